@@ -4,11 +4,13 @@ SAM Local Integration Module
 Integrates Guardrails directly into SAM's code generation pipeline
 """
 
+import functools
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.parsed_files import FileChange, ParsedFiles
 from src.security_rules import SecurityScanner
 from src.standards_checker import StandardsChecker
 
@@ -26,10 +28,8 @@ class SAMGuardrails:
     
     def check_code(self, code: str, filename: str = "generated.py") -> tuple:
         """Check generated code for security and quality issues"""
-        file_data = [{
-            'file': filename,
-            'content': code
-        }]
+        # Built once and walked by both scanners
+        file_data = ParsedFiles.from_changes([FileChange(filename, code)])
         
         security_issues = self.security_scanner.scan(file_data)
         standards_issues = self.standards_checker.scan(file_data)
@@ -49,7 +49,7 @@ class SAMGuardrails:
         if not issues:
             return "✅ No issues found"
         
-        output = f"⚠️ Found {len(issues)} issue(s):\n\n"
+        parts = [f"⚠️ Found {len(issues)} issue(s):\n\n"]
         
         for i, issue in enumerate(issues, 1):
             severity = issue.get('severity', 'UNKNOWN')
@@ -57,16 +57,27 @@ class SAMGuardrails:
             line = issue.get('line', 'N/A')
             fix = issue.get('fix', 'N/A')
             
-            output += f"{i}. [{severity}] Line {line}\n"
-            output += f"   {message}\n"
-            output += f"   Fix: {fix}\n\n"
+            parts.append(
+                f"{i}. [{severity}] Line {line}\n"
+                f"   {message}\n"
+                f"   Fix: {fix}\n\n"
+            )
         
-        return output
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_guardrails() -> SAMGuardrails:
+    """Build the scanners (and compile their rules) once per process.
+
+    Safe to share: SAMGuardrails holds no per-check state.
+    """
+    return SAMGuardrails()
 
 
 def check_code_before_save(code: str, filename: str = "generated.py"):
     """Convenience function for SAM integration"""
-    guardrails = SAMGuardrails()
+    guardrails = _shared_guardrails()
     is_safe, issues = guardrails.check_code(code, filename)
     report = guardrails.format_issues(issues)
     return is_safe, report
@@ -1,8 +1,15 @@
 import os
 import json
+import asyncio
 from typing import Dict, List, Optional
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI
+from aiolimiter import AsyncLimiter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 class AIReviewError(Exception):
@@ -12,11 +19,12 @@ class AIReviewError(Exception):
 class AIReviewer:
     """Performs AI-based code reviews using OpenAI's API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_requests_per_minute: int = 60):
         """Initialize the AIReviewer with the OpenAI client.
         
         Args:
             api_key: Optional OpenAI API key. If not provided, uses OPENAI_API_KEY environment variable.
+            max_requests_per_minute: Upper bound on review requests sent to OpenAI per minute.
         
         Raises:
             ValueError: If no API key is provided and environment variable is not set.
@@ -24,9 +32,10 @@ class AIReviewer:
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key must be provided or set in OPENAI_API_KEY environment variable.")
-        self.client = OpenAI(api_key=api_key, timeout=30.0)
+        self.client = AsyncOpenAI(api_key=api_key, timeout=30.0, max_retries=5)
+        self._limiter = AsyncLimiter(max_requests_per_minute, 60)
     
-    def review_code(self, code_diff: str) -> Dict[str, str | List[str]]:
+    async def review_code(self, code_diff: str) -> Dict[str, str | List[str]]:
         """Analyzes the provided code diff and generates a review.
         
         Args:
@@ -37,12 +46,13 @@ class AIReviewer:
         """
         try:
             prompt = self._build_prompt(code_diff)
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.2,
-                max_tokens=1000
-            )
+            async with self._limiter:
+                response = await self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.2,
+                    max_tokens=1000
+                )
             return self._parse_response(response.choices[0].message.content)
         except Exception as e:
             return {
@@ -51,6 +61,17 @@ class AIReviewer:
                 "severity": "INFO"
             }
     
+    async def review_codes(self, code_diffs: List[str]) -> List[Dict[str, str | List[str]]]:
+        """Review several code diffs concurrently.
+        
+        Args:
+            code_diffs: Code diffs to review.
+        
+        Returns:
+            One review dictionary per diff, in the same order as code_diffs.
+        """
+        return await asyncio.gather(*(self.review_code(diff) for diff in code_diffs))
+    
     def _build_prompt(self, code_diff: str) -> str:
         return f"""Analyze this code diff and provide:
 1. Brief summary of issues
@@ -62,7 +83,7 @@ Code Diff:
     
     def _parse_response(self, response: str) -> Dict[str, str | List[str]]:
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             valid_severity = {"CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"}
             
             if not all(key in data for key in ("summary", "suggestions", "severity")):
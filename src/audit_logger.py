@@ -1,20 +1,42 @@
 import json
+import queue
 import sys
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 
 class AuditLogger:
-    """Logs code scan results in structured format with thread-safe file operations."""
+    """Logs code scan results in structured format with thread-safe file operations.
+
+    Events are queued by log_scan and written in batches by a background
+    thread, so callers never wait on file I/O.
+    """
 
-    _lock = threading.Lock()
+    # Maximum number of queued events written with a single write() call.
+    BATCH_SIZE = 256
+    # Under sustained load, flush the file buffer after this many batches.
+    FLUSH_EVERY = 8
 
     def __init__(self) -> None:
-        """Initialize logger and ensure log directory exists."""
+        """Initialize logger, open the log file, and start the writer thread."""
         self.log_file = Path("logs/audit.log")
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.log_file.open("ab", buffering=1 << 16)
+        self._q: "queue.Queue[Optional[Tuple[int, Dict[str, Any]]]]" = queue.Queue()
+        # Guards _closed, so no event is queued behind close()'s stop marker.
+        self._lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._drain, name="audit-log-writer", daemon=True)
+        self._writer.start()
 
     def log_scan(
         self,
@@ -25,6 +47,10 @@ class AuditLogger:
     ) -> None:
         """Record a code scan event with metadata and results.
 
+        The event is serialized later by the writer thread, so findings must
+        not be modified after this call. Events logged after close() are
+        dropped with a message on stderr.
+
         Args:
             pr_number: Associated pull request identifier
             commit_sha: Git commit hash that was analyzed
@@ -32,16 +58,71 @@ class AuditLogger:
             policy_action: Final enforcement decision based on findings
         """
         log_data = {
-            "timestamp": datetime.now().isoformat(),
             "pr_number": pr_number,
             "commit_sha": commit_sha,
             "findings": findings,
             "policy_action": policy_action,
         }
+        with self._lock:
+            if self._closed:
+                print(f"Audit log event dropped, logger closed: PR {pr_number}", file=sys.stderr)
+                return
+            self._q.put((time.time_ns(), log_data))
+
+    def close(self) -> None:
+        """Write all queued events, then stop the writer thread and close the file.
 
+        Calling close() again does nothing.
+        """
         with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._q.put(None)
+        self._writer.join()
+        self._fh.close()
+
+    def _drain(self) -> None:
+        """Writer thread loop: batch queued events into single writes."""
+        unflushed = 0
+        # Formatting a timestamp is mostly the date and time of day; that part
+        # only changes once a second, so it is cached across events.
+        cached_second = -1
+        cached_prefix = ""
+        while True:
+            batch = [self._q.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            closing = False
+            for item in batch:
+                if item is None:
+                    closing = True
+                    break
+                logged_ns, log_data = item
+                second, remainder_ns = divmod(logged_ns, 1_000_000_000)
+                if second != cached_second:
+                    cached_second = second
+                    cached_prefix = datetime.fromtimestamp(second).isoformat()
+                timestamp = f"{cached_prefix}.{remainder_ns // 1000:06d}"
+                try:
+                    lines.append(_json_dumps({"timestamp": timestamp, **log_data}))
+                except (TypeError, ValueError) as e:
+                    print(f"Audit log event dropped, not serializable: {e}", file=sys.stderr)
+
             try:
-                with self.log_file.open("a", encoding="utf-8") as f:
-                    f.write(json.dumps(log_data) + "\n")
+                if lines:
+                    self._fh.write(b"\n".join(lines) + b"\n")
+                    unflushed += 1
+                if unflushed and (closing or unflushed >= self.FLUSH_EVERY or self._q.empty()):
+                    self._fh.flush()
+                    unflushed = 0
             except OSError as e:
                 print(f"Audit log write failed: {e}", file=sys.stderr)
+
+            if closing:
+                return
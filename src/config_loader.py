@@ -6,16 +6,78 @@ YAML configuration loader and validator.
 
 from __future__ import annotations
 
+import copy
+import functools
 import pathlib
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ConfigError(Exception):
     """Raised whenever the configuration file is missing required fields or has invalid data."""
 
 
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML file. Cached per path and modification time, so an edited
+    file is parsed again while unchanged files are parsed only once.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_SafeLoader)
+
+
+def _compile_defaults(defaults: Dict[Tuple[str, ...], Any]) -> Callable[[Dict[str, Any]], None]:
+    """
+    Build a function that fills in every default of *defaults*, one unrolled
+    block per field path. Intermediate mappings are created as needed; a
+    path whose parent is not a mapping is left for validation to report.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _apply_defaults(config):"]
+    for index, (field_path, default_value) in enumerate(defaults.items()):
+        namespace[f"_default{index}"] = default_value
+        lines.append("    node = config")
+        for key in field_path[:-1]:
+            lines.append(f"    node = node.setdefault({key!r}, {{}}) if isinstance(node, dict) else None")
+        lines.append("    if isinstance(node, dict):")
+        lines.append(f"        node.setdefault({field_path[-1]!r}, _default{index})")
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace["_apply_defaults"]
+
+
+def _compile_validator(required_fields: Dict[Tuple[str, ...], type]) -> Callable[[Dict[str, Any]], None]:
+    """
+    Build a function that checks every field of *required_fields*, one
+    unrolled block per field path, raising ConfigError on the first field
+    that is missing or has the wrong type.
+    """
+    namespace: Dict[str, Any] = {"ConfigError": ConfigError}
+    lines = ["def _validate_required_fields(config):"]
+    for index, (field_path, expected_type) in enumerate(required_fields.items()):
+        joined = ".".join(field_path)
+        missing = f"Missing required field: {joined}"
+        invalid = f"Invalid type for field {joined}: expected {expected_type.__name__}, got "
+        namespace[f"_type{index}"] = expected_type
+        lines.append(f"    value = config.get({field_path[0]!r})")
+        for key in field_path[1:]:
+            lines.append(f"    value = value.get({key!r}) if isinstance(value, dict) else None")
+        lines.append("    if value is None:")
+        lines.append(f"        raise ConfigError({missing!r})")
+        lines.append(f"    if not isinstance(value, _type{index}):")
+        lines.append(f"        raise ConfigError({invalid!r} + type(value).__name__)")
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace["_validate_required_fields"]
+
+
 class ConfigLoader:
     """
     Loads and validates a YAML configuration file.
@@ -47,6 +109,23 @@ class ConfigLoader:
         ("ai", "model"): "gpt-4",
     }
 
+    # Generated by _compile_checks from _DEFAULTS and _REQUIRED_FIELDS.
+    _apply_defaults: Callable[[Dict[str, Any]], None]
+    _validate_required_fields: Callable[[Dict[str, Any]], None]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile_checks()
+
+    @classmethod
+    def _compile_checks(cls) -> None:
+        """
+        Generate straight-line versions of the defaults and required-field
+        checks, so loading a config does not walk the field tables.
+        """
+        cls._apply_defaults = staticmethod(_compile_defaults(cls._DEFAULTS))
+        cls._validate_required_fields = staticmethod(_compile_validator(cls._REQUIRED_FIELDS))
+
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
@@ -79,38 +158,16 @@ class ConfigLoader:
             raise ConfigError(f"Configuration file not found: {p}")
 
         try:
-            with p.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
-                if not isinstance(data, dict):
-                    raise ConfigError("Top-level YAML structure must be a mapping.")
-                return data
+            cached = _load_yaml_cached(str(p.resolve()), p.stat().st_mtime_ns)
         except yaml.YAMLError as exc:
             raise ConfigError(f"Failed to parse YAML: {exc}") from exc
 
-    def _apply_defaults(self, config: Dict[str, Any]) -> None:
-        for field_path, default_value in self._DEFAULTS.items():
-            node = config
-            for key in field_path[:-1]:
-                node = node.setdefault(key, {}) if isinstance(node, dict) else None
-                if node is None:
-                    break
-            if node is not None:
-                node.setdefault(field_path[-1], default_value)
-
-    def _validate_required_fields(self, config: Dict[str, Any]) -> None:
-        for field_path, expected_type in self._REQUIRED_FIELDS.items():
-            value = self._get_nested_value(config, field_path)
-            if value is None:
-                joined = ".".join(field_path)
-                raise ConfigError(f"Missing required field: {joined}")
-
-            if not isinstance(value, expected_type):
-                joined = ".".join(field_path)
-                actual_type = type(value).__name__
-                expected_name = expected_type.__name__
-                raise ConfigError(
-                    f"Invalid type for field {joined}: expected {expected_name}, got {actual_type}"
-                )
+        # Callers mutate the result (defaults are filled in), so never hand
+        # out the cached object itself.
+        data = copy.deepcopy(cached) or {}
+        if not isinstance(data, dict):
+            raise ConfigError("Top-level YAML structure must be a mapping.")
+        return data
 
     def _validate_policy_mode(self, config: Dict[str, Any]) -> None:
         mode = self._get_nested_value(config, ("policy", "mode"))
@@ -131,3 +188,6 @@ class ConfigLoader:
             if node is None:
                 return None
         return node
+
+
+ConfigLoader._compile_checks()
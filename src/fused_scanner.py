@@ -0,0 +1,125 @@
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from .rule_prefilter import candidate_lines, compile_lookaheads
+
+
+class FusedScanner:
+    """Applies security, standards and license line rules in one pass over added lines.
+
+    Each rule is a dict with 'regex', 'severity', 'message' and 'fix', plus
+    either 'type' or the security rules' 'owasp'/'cwe' pair. Findings are
+    tagged with the category of the rule list they came from.
+    """
+
+    # Added lines are joined into one buffer per batch so the regex engine,
+    # not the interpreter, walks past lines without a hit.
+    BATCH_LINES = 1024
+
+    def __init__(
+        self,
+        security_rules: List[Dict[str, Any]],
+        standards_rules: List[Dict[str, Any]],
+        license_rules: List[Dict[str, Any]],
+    ) -> None:
+        """Initialize the scanner with the rule lists of the three scanners.
+
+        Args:
+            security_rules: Rules from SecurityScanner.
+            standards_rules: Rules from StandardsChecker.LINE_RULES.
+            license_rules: Rules from LicenseChecker.LINE_RULES.
+        """
+        self._rules: List[Tuple[str, Dict[str, Any]]] = [
+            (category, rule)
+            for category, rules in (
+                ('security', security_rules),
+                ('standards', standards_rules),
+                ('license', license_rules),
+            )
+            for rule in rules
+        ]
+        self._prefilter = compile_lookaheads(
+            rule['regex'].pattern for _, rule in self._rules
+        ) if self._rules else None
+
+    def scan_lines(self, added_lines: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scan added lines against every rule in a single pass.
+
+        Args:
+            added_lines: Dicts with filename, line_number, and content, as
+                yielded by PRScanner.scan_pr. Consumed once.
+
+        Returns:
+            List of findings with file, line, severity, type, message, fix and category.
+        """
+        findings: List[Dict[str, Any]] = []
+        if self._prefilter is None:
+            return findings
+
+        lines = iter(added_lines)
+        carry: List[Dict[str, Any]] = []
+        while True:
+            fresh = list(islice(lines, self.BATCH_LINES))
+            batch = carry + fresh
+            if not batch:
+                break
+            done = len(fresh) < self.BATCH_LINES
+            # The last line of a full batch waits for the next one, so every
+            # rule can see the line below it.
+            limit = len(batch) if done else len(batch) - 1
+            self._scan_batch(batch, limit, findings)
+            if done:
+                break
+            carry = batch[limit:]
+        return findings
+
+    def _scan_batch(self, batch: List[Dict[str, Any]], limit: int, findings: List[Dict[str, Any]]) -> None:
+        """Append the findings for batch[:limit], searching the batch in one pass.
+
+        Contents are expected to be single lines, as yielded by PRScanner.
+        """
+        buffer = '\n'.join(line['content'] for line in batch)
+        for idx, _, _ in candidate_lines(self._prefilter, buffer, 0, len(buffer)):
+            if idx >= limit:
+                break
+            next_line = batch[idx + 1] if idx + 1 < len(batch) else None
+            self._scan_line(batch[idx], next_line, findings)
+
+    def _scan_line(
+        self,
+        line: Dict[str, Any],
+        next_line: Optional[Dict[str, Any]],
+        findings: List[Dict[str, Any]],
+    ) -> None:
+        """Append the findings for one added line that hit the combined pattern."""
+        content = line['content']
+        for category, rule in self._rules:
+            match = rule['regex'].search(content)
+            if not match:
+                continue
+            token = rule.get('unless_next_line')
+            if token and self._next_line_has(line, next_line, token):
+                continue
+            findings.append({
+                'file': line['filename'],
+                'line': line['line_number'],
+                'severity': rule['severity'],
+                'type': rule.get('type') or f"{rule['owasp']} ({rule['cwe']})",
+                'message': rule['message'].replace('{match}', match.group(0)),
+                'fix': rule['fix'],
+                'category': category
+            })
+
+    @staticmethod
+    def _next_line_has(line: Dict[str, Any], next_line: Optional[Dict[str, Any]], token: str) -> bool:
+        """Whether the line directly below was added and contains token.
+
+        Only added lines are visible here, so a line below that was not part
+        of the diff counts as not containing the token.
+        """
+        return (
+            next_line is not None
+            and next_line['filename'] == line['filename']
+            and next_line['line_number'] == line['line_number'] + 1
+            and token in next_line['content']
+        )
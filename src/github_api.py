@@ -1,6 +1,12 @@
-import requests
+import asyncio
+import httpx
 import base64
-from typing import List
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Tuple
+
+from aiolimiter import AsyncLimiter
 
 
 class GitHubAPIError(Exception):
@@ -8,6 +14,21 @@ class GitHubAPIError(Exception):
 
 
 class GitHubAPI:
+    # Retry policy for transient failures: connection errors are retried for
+    # every request, rate-limit and 5xx responses only for GETs, since
+    # repeating a POST could duplicate a comment.
+    MAX_RETRIES = 5
+    BACKOFF_FACTOR = 0.2
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Longest server-requested wait (Retry-After or X-RateLimit-Reset) that is
+    # slept through; a longer one is returned to the caller instead.
+    MAX_RETRY_AFTER = 60
+    # Decoded blob contents kept in memory, least recently used evicted first.
+    BLOB_CACHE_SIZE = 4096
+    # GitHub allows 5000 authenticated requests per hour per token; blob
+    # fetches that miss the cache are held to it.
+    RATE_LIMIT = (5000, 3600)
+
     def __init__(self, token: str, repo: str):
         self.token = token
         try:
@@ -19,60 +40,133 @@ class GitHubAPI:
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                retries=self.MAX_RETRIES,
+            ),
+            timeout=30,
+        )
+        self._blob_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._limiter = AsyncLimiter(*self.RATE_LIMIT)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.client.aclose()
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL, retrying rate-limited and 5xx responses.
+
+        Waits as long as the server asks when it says so, otherwise backs
+        off exponentially.
+        """
+        attempt = 0
+        while True:
+            response = await self.client.get(url, **kwargs)
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                return response
+            delay = self._retry_after(response)
+            if delay is None:
+                delay = self.BACKOFF_FACTOR * (2 ** attempt)
+            elif delay > self.MAX_RETRY_AFTER:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
 
-    def get_pr_diff(self, pr_number: int) -> str:
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds the server asked to wait before retrying, if it said.
+
+        Reads Retry-After (seconds or an HTTP date), then GitHub's
+        X-RateLimit-Reset (epoch seconds) once the rate limit is used up.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                try:
+                    return max(0.0, float(reset) - time.time())
+                except ValueError:
+                    pass
+        return None
+
+    async def get_pr_diff(self, pr_number: int) -> str:
         """Retrieve the diff for a pull request."""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo_name}/pulls/{pr_number}"
-        headers = self.headers.copy()
-        headers["Accept"] = "application/vnd.github.v3.diff"
         try:
-            response = requests.get(url, headers=headers)
+            response = await self._get(url, headers={"Accept": "application/vnd.github.v3.diff"})
             response.raise_for_status()
             return response.text
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise GitHubAPIError(f"Failed to get PR diff: {e}") from e
 
-    def post_pr_comment(self, pr_number: int, body: str) -> None:
+    async def post_pr_comment(self, pr_number: int, body: str) -> None:
         """Post a comment on a pull request."""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo_name}/issues/{pr_number}/comments"
         try:
-            response = requests.post(url, headers=self.headers, json={"body": body})
+            response = await self.client.post(url, json={"body": body})
             response.raise_for_status()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise GitHubAPIError(f"Failed to post PR comment: {e}") from e
 
-    def post_commit_status(self, commit_sha: str, state: str, description: str) -> None:
+    async def post_commit_status(self, commit_sha: str, state: str, description: str) -> None:
         """Post a commit status."""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo_name}/statuses/{commit_sha}"
         data = {"state": state, "description": description}
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = await self.client.post(url, json=data)
             response.raise_for_status()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise GitHubAPIError(f"Failed to post commit status: {e}") from e
 
-    def get_file_content(self, path: str) -> str:
-        """Get the content of a file in the repository."""
-        url = f"{self.base_url}/repos/{self.owner}/{self.repo_name}/contents/{path}"
+    async def get_blob(self, sha: str) -> str:
+        """Get the content of a blob by SHA.
+
+        Blobs are content-addressed and never change, so a cached blob is
+        returned without contacting GitHub at all and without spending a
+        RATE_LIMIT token.
+        """
+        cached = self._blob_cache.get(sha)
+        if cached is not None:
+            self._blob_cache.move_to_end(sha)
+            return cached
+
+        url = f"{self.base_url}/repos/{self.owner}/{self.repo_name}/git/blobs/{sha}"
         try:
-            response = requests.get(url, headers=self.headers)
+            async with self._limiter:
+                response = await self._get(url)
             response.raise_for_status()
-            content = response.json()["content"]
-            return base64.b64decode(content).decode("utf-8")
-        except requests.exceptions.RequestException as e:
-            raise GitHubAPIError(f"Failed to get file content: {e}") from e
+            content = base64.b64decode(response.json()["content"]).decode("utf-8")
+        except httpx.HTTPError as e:
+            raise GitHubAPIError(f"Failed to get blob: {e}") from e
         except (KeyError, base64.binascii.Error) as e:
-            raise GitHubAPIError(f"Failed to decode file content: {e}") from e
+            raise GitHubAPIError(f"Failed to decode blob: {e}") from e
+
+        self._blob_cache[sha] = content
+        if len(self._blob_cache) > self.BLOB_CACHE_SIZE:
+            self._blob_cache.popitem(last=False)
+        return content
 
-    def get_files(self) -> List[str]:
-        """Get a list of all files in the main branch."""
+    async def get_files(self) -> List[Tuple[str, str]]:
+        """Get the path and blob SHA of every file in the main branch."""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo_name}/git/trees/main?recursive=1"
         try:
-            response = requests.get(url, headers=self.headers)
+            response = await self._get(url)
             response.raise_for_status()
             tree = response.json().get("tree", [])
-            return [item["path"] for item in tree if item.get("type") == "blob"]
-        except requests.exceptions.RequestException as e:
+            return [(item["path"], item["sha"]) for item in tree if item.get("type") == "blob"]
+        except httpx.HTTPError as e:
             raise GitHubAPIError(f"Failed to get files: {e}") from e
         except (KeyError, TypeError) as e:
             raise GitHubAPIError(f"Failed to parse files response: {e}") from e
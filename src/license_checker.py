@@ -1,15 +1,40 @@
+import asyncio
 import re
 from typing import List, Dict, Any
 
 class LicenseChecker:
     """Scans repository files for license and copyright violations."""
+
+    # Concurrent file fetches in flight at once.
+    FETCH_CONCURRENCY = 20
+
+    _RESTRICTED_RE = re.compile(r'(GPL|AGPL|LGPL)-?\d?\.?\d?')
+    _COPYRIGHT_RE = re.compile(r'Copyright \(c\) \d{4}')
+
+    # Per-line rules for the fused PR scan (see FusedScanner). License
+    # conflicts and missing copyright headers need the whole repository or
+    # file, so they stay in scan(). '{match}' is replaced by the matched text.
+    LINE_RULES: List[Dict[str, Any]] = [
+        {
+            'regex': _RESTRICTED_RE,
+            'severity': 'HIGH',
+            'type': 'restricted_license',
+            'message': "Found restricted license '{match}'",
+            'fix': 'Replace with MIT, Apache/BSD'
+        }
+    ]
     
     def __init__(self, github_api: Any) -> None:
         self.github_api = github_api
         
-    def scan(self) -> List[Dict[str, Any]]:
+    async def scan(self) -> List[Dict[str, Any]]:
         """Scan files for license and copyright issues.
         
+        Files are fetched by blob SHA, so unchanged files are served from the
+        GitHub client's cache. Fetches run concurrently, bounded by
+        FETCH_CONCURRENCY and, for cache misses, the client's rate limit;
+        files that cannot be fetched are skipped.
+        
         Returns:
             List of issues found, each with file, line, severity, type, message, and fix.
         """
@@ -18,7 +43,7 @@ class LicenseChecker:
         
         issues = []
         try:
-            files = self.github_api.get_files()
+            files = await self.github_api.get_files()
         except Exception:
             return []
         
@@ -27,50 +52,72 @@ class LicenseChecker:
         except Exception:
             proprietary = False
         
-        restricted_re = re.compile(r'(GPL|AGPL|LGPL)-?\d?\.?\d?')
-        copyright_re = re.compile(r'Copyright \(c\) \d{4}')
+        sem = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(self._fetch_and_scan(file, sha, sem, proprietary))
+            for file, sha in files
+        ]
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                continue
+            issues.extend(result)
         
-        for file in files:
-            try:
-                content = self.github_api.get_file_content(file)
-            except Exception:
+        return issues
+
+    async def _fetch_and_scan(
+        self,
+        file: str,
+        sha: str,
+        sem: asyncio.Semaphore,
+        proprietary: bool,
+    ) -> List[Dict[str, Any]]:
+        """Fetch a single file and scan its content."""
+        async with sem:
+            content = await self.github_api.get_blob(sha)
+        
+        issues = []
+        # One pass over the whole file per pattern; line numbers come from
+        # counting newlines between matches.
+        pos = 0
+        line_num = 1
+        reported_line = 0
+        for license_match in self._RESTRICTED_RE.finditer(content):
+            start = license_match.start()
+            line_num += content.count('\n', pos, start)
+            pos = start
+            if line_num == reported_line:
+                # Only the first restricted license on a line is reported
                 continue
-            
-            lines = content.split('\n')
-            has_copyright = False
-            
-            for line_num, line in enumerate(lines, 1):
-                license_match = restricted_re.search(line)
-                if license_match:
-                    license_type = license_match.group(1)
-                    issues.append({
-                        'file': file,
-                        'line': line_num,
-                        'severity': 'HIGH',
-                        'type': 'restricted_license',
-                        'message': f"Found restricted license '{license_match.group(0)}'",
-                        'fix': 'Replace with MIT, Apache/BSD'
-                    })
-                    if license_type == 'GPL' and proprietary:
-                        issues.append({
-                            'file': file,
-                            'line': line_num,
-                            'severity': 'HIGH',
-                            'type': 'license_conflict',
-                            'message': 'GPL in proprietary project',
-                            'fix': 'Remove GPL or change project license'
-                        })
-                if copyright_re.search(line):
-                    has_copyright = True
-            
-            if not has_copyright:
+            reported_line = line_num
+            license_type = license_match.group(1)
+            issues.append({
+                'file': file,
+                'line': line_num,
+                'severity': 'HIGH',
+                'type': 'restricted_license',
+                'message': f"Found restricted license '{license_match.group(0)}'",
+                'fix': 'Replace with MIT, Apache/BSD'
+            })
+            if license_type == 'GPL' and proprietary:
                 issues.append({
                     'file': file,
-                    'line': 0,
-                    'severity': 'MEDIUM',
-                    'type': 'missing_copyright',
-                    'message': 'Missing copyright header',
-                    'fix': "Add 'Copyright (c) <year> <owner>'"
+                    'line': line_num,
+                    'severity': 'HIGH',
+                    'type': 'license_conflict',
+                    'message': 'GPL in proprietary project',
+                    'fix': 'Remove GPL or change project license'
                 })
         
+        has_copyright = self._COPYRIGHT_RE.search(content) is not None
+        
+        if not has_copyright:
+            issues.append({
+                'file': file,
+                'line': 0,
+                'severity': 'MEDIUM',
+                'type': 'missing_copyright',
+                'message': 'Missing copyright header',
+                'fix': "Add 'Copyright (c) <year> <owner>'"
+            })
+        
         return issues
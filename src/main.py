@@ -1,23 +1,49 @@
-from fastapi import FastAPI, Request, BackgroundTasks, HTTPException, status
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Set
+
+from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from src.github_api import GitHubAPI
 from src.scanner import PRScanner
 from src.security_rules import SecurityScanner
 from src.standards_checker import StandardsChecker
 from src.license_checker import LicenseChecker
+from src.fused_scanner import FusedScanner
 from src.policy_engine import PolicyEngine
 from src.audit_logger import AuditLogger
 from src.config_loader import ConfigLoader
 
-app = FastAPI(title="GitHub Copilot Guardrails")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """On shutdown, wait for in-flight scans, then release the GitHub pool and audit log"""
+    yield
+    if _scan_tasks:
+        await asyncio.gather(*_scan_tasks, return_exceptions=True)
+    await github_api.aclose()
+    audit_logger.close()
+
+
+app = FastAPI(title="GitHub Copilot Guardrails", lifespan=lifespan)
 
 config = ConfigLoader().load_config("config.yml")
 github_api = GitHubAPI(config["github"]["token"], config["github"]["repo"])
 audit_logger = AuditLogger()
+fused_scanner = FusedScanner(
+    SecurityScanner().rules if config["security"]["enabled"] else [],
+    StandardsChecker.LINE_RULES if config["standards"]["enabled"] else [],
+    LicenseChecker.LINE_RULES if config["license"]["enabled"] else [],
+)
+
+# Upper bound on PRs scanned at the same time; further webhooks wait their turn.
+MAX_CONCURRENT_SCANS = 10
+_scan_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCANS)
+_scan_tasks: Set[asyncio.Task] = set()
 
 
 @app.post("/webhook")
-async def webhook(request: Request, background_tasks: BackgroundTasks):
+async def webhook(request: Request):
     """Handle GitHub webhook events for pull requests"""
     try:
         payload = await request.json()
@@ -38,47 +64,52 @@ async def webhook(request: Request, background_tasks: BackgroundTasks):
     if not pr_number or not commit_sha:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing PR number or commit SHA")
 
-    background_tasks.add_task(process_pr, pr_number, commit_sha)
+    task = asyncio.create_task(process_pr(pr_number, commit_sha))
+    _scan_tasks.add(task)
+    task.add_done_callback(_scan_tasks.discard)
     return JSONResponse({"status": "processing", "pr_number": pr_number})
 
 
-def process_pr(pr_number: int, commit_sha: str):
+async def process_pr(pr_number: int, commit_sha: str):
     """Background task to scan PR and apply policy"""
-    try:
-        diff = github_api.get_pr_diff(pr_number)
-        scanner = PRScanner()
-        added_lines = scanner.scan_pr(diff)
-
-        findings = []
-
-        if config["security"]["enabled"]:
-            sec_scanner = SecurityScanner()
-            findings.extend(sec_scanner.scan(added_lines))
-
-        if config["standards"]["enabled"]:
-            std_checker = StandardsChecker()
-            findings.extend(std_checker.check(added_lines))
-
-        if config["license"]["enabled"]:
-            lic_checker = LicenseChecker()
-            findings.extend(lic_checker.check(added_lines))
-
-        policy = PolicyEngine(config["policy"]["mode"])
-        action = policy.evaluate(findings)
-
-        if findings:
-            comment = policy.format_comment(findings)
-            github_api.post_pr_comment(pr_number, comment)
-
-        if action == "BLOCKED":
-            github_api.post_commit_status(commit_sha, "failure", "Guardrails: Critical issues found")
-        elif action == "WARNED":
-            github_api.post_commit_status(commit_sha, "success", "Guardrails: Warnings found")
-        else:
-            github_api.post_commit_status(commit_sha, "success", "Guardrails: No issues")
-
-        audit_logger.log_scan(str(pr_number), commit_sha, findings, action)
-
-    except Exception as e:
-        print(f"Error processing PR {pr_number}: {e}")
-        github_api.post_commit_status(commit_sha, "error", f"Guardrails error: {str(e)}")
+    async with _scan_semaphore:
+        try:
+            diff = await github_api.get_pr_diff(pr_number)
+            scanner = PRScanner()
+            # CPU-bound; run off the event loop so other webhooks and scans
+            # keep moving while a large diff is parsed and matched.
+            findings = await asyncio.to_thread(fused_scanner.scan_lines, scanner.scan_pr(diff))
+
+            result = PolicyEngine(config["policy"]).apply_policy(findings)
+            issues = result["filtered_issues"]
+
+            if issues:
+                await github_api.post_pr_comment(pr_number, _format_comment(issues))
+
+            if result["block_merge"]:
+                action = "BLOCKED"
+                await github_api.post_commit_status(commit_sha, "failure", "Guardrails: Critical issues found")
+            elif issues:
+                action = "WARNED"
+                await github_api.post_commit_status(commit_sha, "success", "Guardrails: Warnings found")
+            else:
+                action = "APPROVED"
+                await github_api.post_commit_status(commit_sha, "success", "Guardrails: No issues")
+
+            audit_logger.log_scan(str(pr_number), commit_sha, findings, action)
+
+        except Exception as e:
+            print(f"Error processing PR {pr_number}: {e}")
+            await github_api.post_commit_status(commit_sha, "error", f"Guardrails error: {str(e)}")
+
+
+def _format_comment(issues: List[Dict[str, Any]]) -> str:
+    """Render the issues left by the policy as a PR comment in Markdown."""
+    parts = [f"### Guardrails found {len(issues)} issue(s)\n\n"]
+    for issue in issues:
+        parts.append(
+            f"- **{issue['severity']}** `{issue['file']}:{issue['line']}` "
+            f"({issue['category']}, {issue['type']}): {issue['message']}\n"
+            f"  Fix: {issue['fix']}\n"
+        )
+    return "".join(parts)
@@ -0,0 +1,55 @@
+import sys
+from dataclasses import dataclass
+from typing import List, Iterator, Tuple
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """A file handed to the scanners, checked once when it is built."""
+
+    __slots__ = ('file', 'content')
+
+    file: str
+    content: str
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.file, str):
+            raise TypeError(f"file must be a string, not {type(self.file).__name__}")
+        if not isinstance(self.content, str):
+            raise TypeError(f"content of {self.file} must be a string, not {type(self.content).__name__}")
+
+
+@dataclass
+class ParsedFiles:
+    """File contents joined into one buffer that every file scanner walks.
+
+    File i spans joined[file_offsets[i]:file_offsets[i + 1] - 1]; files are
+    separated by a newline, so line-anchored patterns and line counting work
+    across the buffer exactly as they do on a single file.
+    """
+
+    names: List[str]
+    joined: str
+    file_offsets: List[int]
+
+    @classmethod
+    def from_changes(cls, file_changes: List[FileChange]) -> 'ParsedFiles':
+        """Build the shared buffer from a list of FileChange.
+
+        Names are interned, so every finding for a file shares one string
+        object however many producers named it.
+        """
+        names: List[str] = []
+        contents: List[str] = []
+        file_offsets = [0]
+        for change in file_changes:
+            names.append(sys.intern(change.file))
+            contents.append(change.content)
+            file_offsets.append(file_offsets[-1] + len(change.content) + 1)
+        return cls(names, '\n'.join(contents), file_offsets)
+
+    def files(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield (name, start, end) of every file's span in joined."""
+        offsets = self.file_offsets
+        for i, name in enumerate(self.names):
+            yield name, offsets[i], offsets[i + 1] - 1
@@ -4,6 +4,8 @@ class PolicyEngine:
     Applies specified policy mode to filter issues and determine merge blocking.
     """
 
+    _HIGH_SEVERITIES = frozenset({'CRITICAL', 'HIGH'})
+
     def __init__(self, config: dict):
         """Initialize PolicyEngine with configuration.
 
@@ -27,6 +29,7 @@ class PolicyEngine:
 
         Returns:
             dict: Actions dict with keys 'post_comment', 'block_merge', 'filtered_issues'.
+                In ADVISORY and BLOCKING mode 'filtered_issues' is the given list itself.
 
         Raises:
             TypeError: If issues is not a list or contains non-dict items.
@@ -34,29 +37,38 @@ class PolicyEngine:
         """
         if not isinstance(issues, list):
             raise TypeError("issues must be a list")
-        
-        for idx, issue in enumerate(issues):
-            if not isinstance(issue, dict):
-                raise TypeError(f"Issue at index {idx} is not a dictionary")
-            if 'severity' not in issue:
-                raise ValueError(f"Issue at index {idx} missing 'severity' key")
 
-        filtered_issues = []
-        if self.mode == 'ADVISORY':
-            filtered_issues = list(issues)
-        elif self.mode == 'WARNING':
-            filtered_issues = [issue for issue in issues if issue['severity'] in {'CRITICAL', 'HIGH'}]
-        elif self.mode == 'BLOCKING':
-            filtered_issues = list(issues)
-        else:
-            raise RuntimeError(f"Invalid policy mode: {self.mode}")
+        self._validate(issues)
 
+        mode = self.mode
         block_merge = False
-        if self.mode == 'BLOCKING':
-            block_merge = any(issue['severity'] == 'CRITICAL' for issue in filtered_issues)
+        if mode == 'ADVISORY':
+            filtered_issues = issues
+        elif mode == 'WARNING':
+            high = self._HIGH_SEVERITIES
+            filtered_issues = [issue for issue in issues if issue['severity'] in high]
+        elif mode == 'BLOCKING':
+            block_merge = any(issue['severity'] == 'CRITICAL' for issue in issues)
+            filtered_issues = issues
+        else:
+            raise RuntimeError(f"Invalid policy mode: {self.mode}")
 
         return {
             "post_comment": True,
             "block_merge": block_merge,
             "filtered_issues": filtered_issues
         }
+
+    @staticmethod
+    def _validate(issues: list) -> None:
+        """Check every issue, raising on the first malformed one.
+
+        Raises:
+            TypeError: If an issue is not a dict.
+            ValueError: If an issue lacks 'severity' key.
+        """
+        for idx, issue in enumerate(issues):
+            if not isinstance(issue, dict):
+                raise TypeError(f"Issue at index {idx} is not a dictionary")
+            if 'severity' not in issue:
+                raise ValueError(f"Issue at index {idx} missing 'severity' key")
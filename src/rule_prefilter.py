@@ -0,0 +1,52 @@
+import re
+from typing import Iterable, Iterator, Pattern, Tuple
+
+
+def compile_lookaheads(patterns: Iterable[str]) -> Pattern[str]:
+    """Compile rule patterns into one pre-filter that matches where any of them would.
+
+    Every pattern becomes a zero-width lookahead in a single alternation.
+    Nothing is consumed, so a hit for one rule never hides another rule's
+    hit; the caller re-runs the rules on each line the filter finds.
+
+    Args:
+        patterns: Regex sources of the rules.
+
+    Returns:
+        Pattern compiled with re.MULTILINE, so ^ and $ anchor at lines.
+    """
+    return re.compile('|'.join(f"(?=(?:{pattern}))" for pattern in patterns), re.MULTILINE)
+
+
+def candidate_lines(prefilter: Pattern[str], content: str, pos: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    """Yield the lines of content[pos:end] that the pre-filter hits.
+
+    Lines without a hit are skipped inside the regex engine. Each line is
+    yielded once, however many rules hit it.
+
+    Args:
+        prefilter: Pattern from compile_lookaheads.
+        content: Buffer holding the lines.
+        pos: Start of the first line.
+        end: End of the last line.
+
+    Yields:
+        (index, start, end) of each hit line: its 0-based index counted
+        from pos, and its bounds in content without the newline.
+    """
+    index = 0
+    match = prefilter.search(content, pos, end)
+    while match:
+        start = match.start()
+        index += content.count('\n', pos, start)
+        line_start = content.rfind('\n', pos, start) + 1 or pos
+        line_end = content.find('\n', start, end)
+        if line_end == -1:
+            line_end = end
+        yield index, line_start, line_end
+        if line_end == end:
+            return
+        # Resume on the next line; the caller covers this one.
+        pos = line_end + 1
+        index += 1
+        match = prefilter.search(content, pos, end)
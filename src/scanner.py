@@ -1,50 +1,63 @@
 import re
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterator
+
+# One alternative per kind of diff line; the outer group of the alternative
+# that matched is reported as lastgroup.
+_DIFF_LINE = re.compile(
+    r'^(?:'
+    r'(?P<diff>diff --git[^\n]*)'
+    r'|(?P<plusplus>\+\+\+(?: b/(?P<file>[^\n]+))?[^\n]*)'
+    r'|(?P<hunk>@@(?: -\d+(?:,\d+)? \+(?P<start>\d+)(?:,\d+)? @@)?[^\n]*)'
+    r'|(?P<removed>-[^\n]*)'
+    r'|(?P<added>\+(?P<content>[^\n]*))'
+    r'|(?P<context>[^\n]*)'
+    r')$',
+    re.MULTILINE
+)
 
 
 class PRScanner:
     """Parse PR diffs and extract added lines"""
     
-    def scan_pr(self, diff: str) -> List[Dict[str, Any]]:
+    def scan_pr(self, diff: str) -> Iterator[Dict[str, Any]]:
         """
         Parse unified diff and extract added lines
         
+        The regex engine walks the diff line by line and added lines are
+        yielded as they are found, so no list of all diff lines or results is
+        built.
+        
         Args:
             diff: Unified diff string from GitHub API
             
-        Returns:
-            List of dicts with filename, line_number, and content
+        Yields:
+            Dicts with filename, line_number, and content
         """
-        added_lines = []
         current_file = None
         line_number = 0
         
-        for line in diff.split('\n'):
-            # Detect file header
-            if line.startswith('diff --git'):
-                current_file = None
-            elif line.startswith('+++'):
-                # Extract filename (remove +++ b/ prefix)
-                match = re.match(r'\+\+\+ b/(.+)', line)
-                if match:
-                    current_file = match.group(1)
-                    line_number = 0
-            elif line.startswith('@@'):
-                # Parse hunk header to get starting line number
-                match = re.match(r'@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@', line)
-                if match:
-                    line_number = int(match.group(1))
-            elif line.startswith('+') and not line.startswith('+++'):
-                # This is an added line
+        for match in _DIFF_LINE.finditer(diff):
+            kind = match.lastgroup
+            if kind == 'context':
+                line_number += 1
+            elif kind == 'added':
                 if current_file:
-                    added_lines.append({
+                    yield {
                         'filename': current_file,
                         'line_number': line_number,
-                        'content': line[1:]  # Remove leading '+'
-                    })
+                        'content': match.group('content')
+                    }
                 line_number += 1
-            elif not line.startswith('-'):
-                # Context line or empty line
-                line_number += 1
-        
-        return added_lines
+            elif kind == 'hunk':
+                # Hunk header gives the starting line number
+                start = match.group('start')
+                if start:
+                    line_number = int(start)
+            elif kind == 'plusplus':
+                # New file name (+++ b/ prefix removed)
+                filename = match.group('file')
+                if filename:
+                    current_file = filename
+                    line_number = 0
+            elif kind == 'diff':
+                current_file = None
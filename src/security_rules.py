@@ -1,5 +1,8 @@
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+
+from .parsed_files import FileChange, ParsedFiles
+from .rule_prefilter import candidate_lines, compile_lookaheads
 
 class SecurityScanner:
     """Scans code files for common security vulnerabilities based on predefined rules."""
@@ -39,27 +42,32 @@ class SecurityScanner:
                 'fix': 'Avoid shell=True; use subprocess with list arguments'
             }
         ]
+        self._prefilter = compile_lookaheads(rule['regex'].pattern for rule in self.rules)
 
-    def scan(self, file_changes: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    def scan(self, file_changes: Union[ParsedFiles, List[FileChange]]) -> List[Dict[str, str]]:
         """Scan provided files for security issues.
 
         Args:
-            file_changes: List of dictionaries containing 'file' and 'content' keys.
+            file_changes: ParsedFiles, or a list of FileChange.
 
         Returns:
             List of detected issues with details about each vulnerability.
         """
+        if not isinstance(file_changes, ParsedFiles):
+            file_changes = ParsedFiles.from_changes(file_changes)
         issues: List[Dict[str, str]] = []
-        for change in file_changes:
+        rules = self.rules
+        prefilter = self._prefilter
+        content = file_changes.joined
+        for file_name, pos, end in file_changes.files():
             try:
-                content = change['content']
-                file_name = change['file']
-                for line_num, line in enumerate(content.split('\n'), 1):
-                    for rule in self.rules:
+                for index, line_start, line_end in candidate_lines(prefilter, content, pos, end):
+                    line = content[line_start:line_end]
+                    for rule in rules:
                         if rule['regex'].search(line):
                             issues.append({
                                 'file': file_name,
-                                'line': line_num,
+                                'line': index + 1,
                                 'severity': rule['severity'],
                                 'type': f"{rule['owasp']} ({rule['cwe']})",
                                 'message': rule['message'],
@@ -1,84 +1,221 @@
 import re
-from typing import List, Dict, Any, Union
+import sys
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
+
+from .parsed_files import FileChange, ParsedFiles
+
+_DEF_UPPER = re.compile(r'^\s*def\s+[A-Z]')
+_CLASS_LOWER = re.compile(r'^\s*class\s+[a-z]')
+_BARE_EXCEPT = re.compile(r'except\s*:')
+_DEF_ANY = re.compile(r'^\s*def\s+.*:')
+
+# (severity, type, message, fix) per rule id.
+_RULES = (
+    ('MEDIUM', 'naming', 'Function name should be snake_case', 'Rename function to snake_case'),
+    ('MEDIUM', 'naming', 'Class name should be PascalCase', 'Rename class to PascalCase'),
+    ('MEDIUM', 'error_handling', 'Bare except clause', 'Specify exception type or use Exception'),
+    ('MEDIUM', 'missing_logging', 'Function missing logging statement',
+     'Add logging statement to function body'),
+)
+_FUNCTION_NAMING, _CLASS_NAMING, _BARE_EXCEPT_CLAUSE, _MISSING_LOGGING = range(len(_RULES))
+
+
+def _find(content: str, word: str, start: int, end: int) -> int:
+    """Return the index of word in content[start:end], or end if it is absent."""
+    at = content.find(word, start, end)
+    return end if at == -1 else at
+
+
+def _first_ident_char(line: str, kw_len: int) -> str:
+    """Return the first non-whitespace character after a keyword, or ''.
+
+    Args:
+        line: Stripped line starting with the keyword
+        kw_len: Length of the keyword
+    """
+    return line[kw_len:].lstrip()[:1]
+
+
+def _find_bare_except(line: str) -> bool:
+    """Pure-Python equivalent of _BARE_EXCEPT.search(line)."""
+    at = line.find('except')
+    while at != -1:
+        if line[at + 6:].lstrip()[:1] == ':':
+            return True
+        at = line.find('except', at + 1)
+    return False
+
+
+# PyPy's JIT traces the string loop above well but runs re comparatively
+# slowly; CPython is the other way round.
+if sys.implementation.name == 'pypy':
+    _has_bare_except = _find_bare_except
+else:
+    _has_bare_except = _BARE_EXCEPT.search
+
+
+def _is_def(stripped: str) -> bool:
+    """Whether a stripped line starts with def and whitespace."""
+    return stripped.startswith('def') and stripped[3:4].isspace()
+
+
+# Line checks. Each gets the line, the line without its indentation, and
+# whether it is a def header (worked out once per line for both def rules).
+
+def _check_function_naming(line: str, stripped: str, is_def: bool) -> bool:
+    """A def whose name starts with an uppercase letter."""
+    return is_def and 'A' <= _first_ident_char(stripped, 3) <= 'Z'
+
+
+def _check_class_naming(line: str, stripped: str, is_def: bool) -> bool:
+    """A class whose name starts with a lowercase letter."""
+    return (not is_def and stripped.startswith('class') and stripped[5:6].isspace()
+            and 'a' <= _first_ident_char(stripped, 5) <= 'z')
+
+
+def _check_bare_except(line: str, stripped: str, is_def: bool) -> bool:
+    """An except clause without an exception type."""
+    return bool(_has_bare_except(line))
+
+
+def _check_def_header(line: str, stripped: str, is_def: bool) -> bool:
+    """A def header, i.e. def, a name and a colon."""
+    return is_def and ':' in stripped[4:]
+
+
+# (rule id, check, unless_next_line) entries, run in this order on every line
+# holding def, class or except; a new rule is a check plus an entry here and
+# in _RULES. As in LINE_RULES, a rule with unless_next_line set only fires
+# when the line below lacks that text.
+_LINE_CHECKS: Tuple[Tuple[int, Callable[[str, str, bool], bool], Optional[str]], ...] = (
+    (_FUNCTION_NAMING, _check_function_naming, None),
+    (_CLASS_NAMING, _check_class_naming, None),
+    (_BARE_EXCEPT_CLAUSE, _check_bare_except, None),
+    (_MISSING_LOGGING, _check_def_header, 'log'),
+)
+
+
+# Regex of each rule for FusedScanner, which sees added diff lines one by one.
+_LINE_RULE_REGEXES = {
+    _FUNCTION_NAMING: _DEF_UPPER,
+    _CLASS_NAMING: _CLASS_LOWER,
+    _BARE_EXCEPT_CLAUSE: _BARE_EXCEPT,
+    _MISSING_LOGGING: _DEF_ANY,
+}
+
+
+def _line_rule(rule_id: int, unless_next_line: Optional[str]) -> Dict[str, Any]:
+    """Build the LINE_RULES entry for a rule id from _RULES."""
+    severity, violation_type, message, fix = _RULES[rule_id]
+    rule = {
+        'regex': _LINE_RULE_REGEXES[rule_id],
+        'severity': severity,
+        'type': violation_type,
+        'message': message,
+        'fix': fix
+    }
+    if unless_next_line:
+        rule['unless_next_line'] = unless_next_line
+    return rule
+
+
+def _next_line_has(content: str, line_end: int, end: int, text: str) -> bool:
+    """Whether the line after the one ending at line_end contains text."""
+    if line_end == end:
+        return False
+    next_end = content.find('\n', line_end + 1, end)
+    return content.find(text, line_end + 1, end if next_end == -1 else next_end) != -1
+
+
+def _violation(file: str, line: int, rule_id: int) -> Dict[str, Union[str, int]]:
+    """Build the violation dict for a rule id from _RULES."""
+    severity, violation_type, message, fix = _RULES[rule_id]
+    return {
+        'file': file,
+        'line': line,
+        'severity': severity,
+        'type': violation_type,
+        'message': message,
+        'fix': fix
+    }
+
+
+def _scan_file(content: str, filename: str, pos: int, end: int) -> Iterator[Dict[str, Union[str, int]]]:
+    """Yield the violations of the file spanning content[pos:end]."""
+    # Every check needs def, class or except, so only the lines
+    # holding one are looked at. str.find skips ahead in C.
+    next_def = _find(content, 'def', pos, end)
+    next_class = _find(content, 'class', pos, end)
+    next_except = _find(content, 'except', pos, end)
+    line_num = 1
+    while True:
+        first = min(next_def, next_class, next_except)
+        if first == end:
+            break
+        line_start = content.rfind('\n', 0, first) + 1
+        line_num += content.count('\n', pos, line_start)
+        line_end = _find(content, '\n', first, end)
+
+        line = content[line_start:line_end]
+        stripped = line.lstrip()
+        is_def = _is_def(stripped)
+        for rule_id, check, unless_next_line in _LINE_CHECKS:
+            if check(line, stripped, is_def) and not (
+                    unless_next_line and _next_line_has(content, line_end, end, unless_next_line)):
+                yield _violation(filename, line_num, rule_id)
+
+        pos = line_end
+        if next_def < pos:
+            next_def = _find(content, 'def', pos, end)
+        if next_class < pos:
+            next_class = _find(content, 'class', pos, end)
+        if next_except < pos:
+            next_except = _find(content, 'except', pos, end)
 
 
 class StandardsChecker:
     """Check code against configured standards and conventions."""
 
+    __slots__ = ('enabled',)
+
+    # Per-line rules for the fused PR scan (see FusedScanner). A rule with
+    # 'unless_next_line' only fires when the line below lacks that text.
+    LINE_RULES: List[Dict[str, Any]] = [
+        _line_rule(rule_id, unless_next_line) for rule_id, _, unless_next_line in _LINE_CHECKS
+    ]
+
     def __init__(self, config: dict) -> None:
         """Initialize checker with configuration."""
         self.enabled = config.get('rules', {}).get('standards', {}).get('enabled', False)
 
-    def scan(self, file_changes: List[Dict[str, Any]]) -> List[Dict[str, Union[str, int]]]:
+    def scan(self, file_changes: Union[ParsedFiles, List[FileChange]]) -> List[Dict[str, Union[str, int]]]:
         """Scan files for standards violations.
         
         Args:
-            file_changes: List of dictionaries with 'file' and 'content' keys
+            file_changes: ParsedFiles, or a list of FileChange
             
         Returns:
             List of violation dictionaries with file, line, severity, type, message, and fix
         """
-        violations: List[Dict[str, Union[str, int]]] = []
+        return list(self.iter_scan(file_changes))
+
+    def iter_scan(self, file_changes: Union[ParsedFiles, List[FileChange]]) -> Iterator[Dict[str, Union[str, int]]]:
+        """Yield standards violations as they are found.
+
+        Lets a caller stop at the first violation it cares about without
+        scanning the rest of the files.
+
+        Args:
+            file_changes: ParsedFiles, or a list of FileChange
+
+        Yields:
+            Violation dictionaries with file, line, severity, type, message, and fix
+        """
         if not self.enabled:
-            return violations
-
-        for change in file_changes:
-            try:
-                filename = change.get('file', '')
-                content = change.get('content', '')
-                if not isinstance(content, str):
-                    continue
-
-                lines = content.split('\n')
-                for idx, line in enumerate(lines):
-                    line_num = idx + 1
-                    
-                    # Naming checks
-                    if re.match(r'^\s*def\s+[A-Z]', line):
-                        violations.append(self._create_violation(
-                            filename, line_num, 'naming',
-                            'Function name should be snake_case',
-                            'Rename function to snake_case'
-                        ))
-                        
-                    if re.match(r'^\s*class\s+[a-z]', line):
-                        violations.append(self._create_violation(
-                            filename, line_num, 'naming', 
-                            'Class name should be PascalCase',
-                            'Rename class to PascalCase'
-                        ))
-                    
-                    # Bare except check
-                    if re.search(r'except\s*:', line):
-                        violations.append(self._create_violation(
-                            filename, line_num, 'error_handling',
-                            'Bare except clause',
-                            'Specify exception type or use Exception'
-                        ))
-                    
-                    # Logging check
-                    if re.match(r'^\s*def\s+.*:', line):
-                        next_idx = idx + 1
-                        if next_idx >= len(lines) or 'log' not in lines[next_idx]:
-                            violations.append(self._create_violation(
-                                filename, line_num, 'missing_logging',
-                                'Function missing logging statement',
-                                'Add logging statement to function body'
-                            ))
-                            
-            except Exception:
-                continue
-
-        return violations
-
-    def _create_violation(self, file: str, line: int, 
-                         violation_type: str, message: str, fix: str) -> Dict[str, Union[str, int]]:
-        """Helper to create standardized violation dictionary."""
-        return {
-            'file': file,
-            'line': line,
-            'severity': 'MEDIUM',
-            'type': violation_type,
-            'message': message,
-            'fix': fix
-        }
+            return
+
+        if not isinstance(file_changes, ParsedFiles):
+            file_changes = ParsedFiles.from_changes(file_changes)
+        content = file_changes.joined
+        for filename, pos, end in file_changes.files():
+            yield from _scan_file(content, filename, pos, end)
@@ -0,0 +1,17 @@
+import httpx
+import pytest
+
+from src.github_api import GitHubAPI
+
+
+@pytest.fixture
+def github_api():
+    """Build a GitHubAPI for owner/repo whose requests go to a handler.
+
+    The handler gets each httpx.Request and returns an httpx.Response.
+    """
+    def build(handler):
+        api = GitHubAPI('test-token', 'owner/repo')
+        api.client = httpx.AsyncClient(headers=api.headers, transport=httpx.MockTransport(handler))
+        return api
+    return build
@@ -0,0 +1,75 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src import audit_logger as audit_logger_module
+from src.audit_logger import AuditLogger
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    """An AuditLogger writing logs/audit.log under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    audit = AuditLogger()
+    yield audit
+    audit.close()
+
+
+def _records(logger):
+    return [json.loads(line) for line in logger.log_file.read_bytes().splitlines()]
+
+
+def test_close_writes_every_queued_event(logger):
+    count = AuditLogger.BATCH_SIZE * 3 + 5
+    for n in range(count):
+        logger.log_scan(str(n), 'abc123', [{'severity': 'LOW', 'line': n}], 'APPROVED')
+
+    logger.close()
+
+    records = _records(logger)
+    assert len(records) == count
+    assert [record['pr_number'] for record in records] == [str(n) for n in range(count)]
+    assert records[7]['findings'] == [{'severity': 'LOW', 'line': 7}]
+    assert records[7]['commit_sha'] == 'abc123'
+    assert records[7]['policy_action'] == 'APPROVED'
+
+
+def test_events_after_close_are_dropped(logger, capsys):
+    logger.log_scan('1', 'abc123', [], 'APPROVED')
+    logger.close()
+
+    logger.log_scan('2', 'abc123', [], 'APPROVED')
+    logger.close()
+
+    assert [record['pr_number'] for record in _records(logger)] == ['1']
+    assert 'Audit log event dropped, logger closed: PR 2' in capsys.readouterr().err
+
+
+def test_timestamps_have_microseconds_across_seconds(logger, monkeypatch):
+    second = 1_700_000_000
+    # (seconds after `second`, microseconds): two events in one second, the
+    # next second, a clock step back, and a whole second.
+    stamps = [(0, 5), (0, 999_999), (1, 42), (0, 7), (2, 0)]
+    clock = iter((second + s) * 1_000_000_000 + us * 1000 for s, us in stamps)
+    monkeypatch.setattr(audit_logger_module.time, 'time_ns', lambda: next(clock))
+    for n in range(len(stamps)):
+        logger.log_scan(str(n), 'abc123', [], 'APPROVED')
+
+    logger.close()
+
+    assert [record['timestamp'] for record in _records(logger)] == [
+        (datetime.fromtimestamp(second + s) + timedelta(microseconds=us)).isoformat(timespec='microseconds')
+        for s, us in stamps
+    ]
+
+
+def test_unserializable_event_is_dropped(logger, capsys):
+    logger.log_scan('1', 'abc123', [], 'APPROVED')
+    logger.log_scan('2', 'abc123', [object()], 'WARNED')
+    logger.log_scan('3', 'abc123', [], 'APPROVED')
+
+    logger.close()
+
+    assert [record['pr_number'] for record in _records(logger)] == ['1', '3']
+    assert 'Audit log event dropped, not serializable' in capsys.readouterr().err
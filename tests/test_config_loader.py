@@ -0,0 +1,100 @@
+import os
+
+import pytest
+import yaml
+
+from src.config_loader import ConfigError, ConfigLoader
+
+GITHUB = "github:\n  token: t\n  repo: owner/repo\n"
+
+
+def _load(tmp_path, text):
+    path = tmp_path / 'config.yml'
+    path.write_text(text, encoding='utf-8')
+    return ConfigLoader().load_config(path)
+
+
+def test_defaults_fill_missing_sections(tmp_path):
+    assert _load(tmp_path, GITHUB) == {
+        'github': {'token': 't', 'repo': 'owner/repo'},
+        'policy': {'mode': 'ADVISORY'},
+        'security': {'enabled': True},
+        'standards': {'enabled': True},
+        'license': {'enabled': True},
+        'ai': {'enabled': False, 'model': 'gpt-4'},
+    }
+
+
+def test_given_values_win_over_defaults(tmp_path):
+    config = _load(tmp_path, GITHUB + "policy:\n  mode: BLOCKING\nai:\n  enabled: true\n")
+
+    assert config['policy'] == {'mode': 'BLOCKING'}
+    assert config['ai'] == {'enabled': True, 'model': 'gpt-4'}
+
+
+@pytest.mark.parametrize('section, field', [
+    ("security: true", 'security.enabled'),
+    ("policy: BLOCKING", 'policy.mode'),
+    ("ai: 5", 'ai.enabled'),
+    ("license:", 'license.enabled'),
+])
+def test_scalar_section_is_missing_field(tmp_path, section, field):
+    with pytest.raises(ConfigError, match=f"^Missing required field: {field}$"):
+        _load(tmp_path, GITHUB + section + "\n")
+
+
+def test_missing_required_field(tmp_path):
+    with pytest.raises(ConfigError, match="^Missing required field: github.repo$"):
+        _load(tmp_path, "github:\n  token: t\n")
+
+
+def test_invalid_type(tmp_path):
+    with pytest.raises(ConfigError, match="^Invalid type for field standards.enabled: expected bool, got str$"):
+        _load(tmp_path, GITHUB + "standards:\n  enabled: 'yes'\n")
+
+
+def test_invalid_policy_mode(tmp_path):
+    with pytest.raises(ConfigError, match="^Invalid policy.mode 'STRICT'"):
+        _load(tmp_path, GITHUB + "policy:\n  mode: STRICT\n")
+
+
+def test_top_level_must_be_mapping(tmp_path):
+    with pytest.raises(ConfigError, match="must be a mapping"):
+        _load(tmp_path, "- a\n- b\n")
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(ConfigError, match="not found"):
+        ConfigLoader().load_config(tmp_path / 'absent.yml')
+
+
+def test_loaded_config_is_not_shared(tmp_path):
+    first = _load(tmp_path, GITHUB)
+    first['policy']['mode'] = 'BLOCKING'
+
+    assert _load(tmp_path, GITHUB)['policy'] == {'mode': 'ADVISORY'}
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, monkeypatch):
+    parses = []
+    yaml_load = yaml.load
+
+    def counting_load(stream, Loader):
+        parses.append(Loader)
+        return yaml_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, 'load', counting_load)
+    path = tmp_path / 'config.yml'
+    path.write_text(GITHUB, encoding='utf-8')
+    loader = ConfigLoader()
+
+    loader.load_config(path)
+    loader.load_config(path)
+    assert len(parses) == 1
+
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text(GITHUB + "policy:\n  mode: BLOCKING\n", encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+
+    assert loader.load_config(path)['policy'] == {'mode': 'BLOCKING'}
+    assert len(parses) == 2
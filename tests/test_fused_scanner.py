@@ -0,0 +1,95 @@
+import pytest
+
+from src.fused_scanner import FusedScanner
+from src.license_checker import LicenseChecker
+from src.security_rules import SecurityScanner
+from src.standards_checker import StandardsChecker
+
+
+def _line(filename, line_number, content):
+    return {'filename': filename, 'line_number': line_number, 'content': content}
+
+
+@pytest.fixture(params=[1, 2, 3, 1024])
+def scanner(request, monkeypatch):
+    """A FusedScanner with every rule, at several batch sizes."""
+    monkeypatch.setattr(FusedScanner, 'BATCH_LINES', request.param)
+    return FusedScanner(SecurityScanner().rules, StandardsChecker.LINE_RULES, LicenseChecker.LINE_RULES)
+
+
+def _summary(findings):
+    return [(f['file'], f['line'], f['category'], f['type']) for f in findings]
+
+
+def test_next_line_across_batch_boundary(scanner):
+    # With one or two lines per batch the def on line 2 is the last line of
+    # a batch and its log call the first line of the next one.
+    lines = [
+        _line('a.py', 1, 'x = 1'),
+        _line('a.py', 2, 'def run():'),
+        _line('a.py', 3, "    log.info('run')"),
+        _line('a.py', 4, 'def stop():'),
+        _line('a.py', 5, '    pass'),
+        _line('a.py', 6, 'def last():'),
+    ]
+
+    assert _summary(scanner.scan_lines(lines)) == [
+        ('a.py', 4, 'standards', 'missing_logging'),
+        ('a.py', 6, 'standards', 'missing_logging'),
+    ]
+
+
+def test_next_line_must_follow_in_the_same_file(scanner):
+    lines = [
+        _line('a.py', 1, 'def stop():'),
+        _line('b.py', 2, 'import logging'),
+        _line('b.py', 3, 'def run():'),
+        _line('b.py', 10, '    log.debug(x)'),
+        _line('b.py', 11, 'def ok():'),
+        _line('b.py', 12, '    log.debug(x)'),
+    ]
+
+    assert _summary(scanner.scan_lines(lines)) == [
+        ('a.py', 1, 'standards', 'missing_logging'),
+        ('b.py', 3, 'standards', 'missing_logging'),
+    ]
+
+
+def test_restricted_license(scanner):
+    findings = scanner.scan_lines([_line('LICENSE', 5, 'Licensed under GPL-3.0 or LGPL-2.1')])
+
+    assert findings == [{
+        'file': 'LICENSE',
+        'line': 5,
+        'severity': 'HIGH',
+        'type': 'restricted_license',
+        'message': "Found restricted license 'GPL-3.0'",
+        'fix': 'Replace with MIT, Apache/BSD',
+        'category': 'license'
+    }]
+
+
+def test_several_rules_on_one_line(scanner):
+    lines = [
+        _line('b.py', 1, 'x = 1'),
+        _line('b.py', 2, 'def Run(): eval(x)  # except: pass'),
+        _line('b.py', 3, 'y = 2'),
+    ]
+
+    assert [(f['line'], f['category'], f['type'], f['severity']) for f in scanner.scan_lines(lines)] == [
+        (2, 'security', 'A01: Injection (CWE-94)', 'HIGH'),
+        (2, 'standards', 'naming', 'MEDIUM'),
+        (2, 'standards', 'error_handling', 'MEDIUM'),
+        (2, 'standards', 'missing_logging', 'MEDIUM'),
+    ]
+
+
+def test_findings_keep_line_order_over_many_batches(scanner):
+    lines = [_line('a.py', n, 'eval(x)' if n % 3 == 0 else 'x = 1') for n in range(1, 31)]
+
+    assert [f['line'] for f in scanner.scan_lines(iter(lines))] == list(range(3, 31, 3))
+
+
+def test_no_lines_and_no_rules(scanner):
+    assert scanner.scan_lines([]) == []
+    assert FusedScanner([], [], []).scan_lines([_line('a.py', 1, 'eval(x)')]) == []
@@ -0,0 +1,172 @@
+import asyncio
+import base64
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from src import github_api as github_api_module
+from src.github_api import GitHubAPI, GitHubAPIError
+
+NOW = 1_700_000_000.0
+DIFF_URL = 'https://api.github.com/repos/owner/repo/pulls/7'
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record asyncio.sleep delays instead of sleeping, with time frozen at NOW."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+    monkeypatch.setattr(github_api_module.time, 'time', lambda: NOW)
+    return delays
+
+
+def _replay(*responses):
+    """A handler answering with responses in turn and recording the requests."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses[min(len(requests), len(responses)) - 1]
+    handler.requests = requests
+    return handler
+
+
+def _get(api):
+    return asyncio.run(api._get(DIFF_URL))
+
+
+def test_retry_after_seconds(github_api, sleeps):
+    handler = _replay(httpx.Response(429, headers={'Retry-After': '3'}), httpx.Response(200))
+
+    assert _get(github_api(handler)).status_code == 200
+    assert len(handler.requests) == 2
+    assert sleeps == [3.0]
+
+
+def test_retry_after_http_date(github_api, sleeps):
+    retry_at = formatdate(NOW + 10, usegmt=True)
+    handler = _replay(httpx.Response(503, headers={'Retry-After': retry_at}), httpx.Response(200))
+
+    assert _get(github_api(handler)).status_code == 200
+    assert sleeps == [10.0]
+
+
+def test_rate_limit_reset(github_api, sleeps):
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(NOW) + 7)}
+    handler = _replay(httpx.Response(429, headers=headers), httpx.Response(200))
+
+    assert _get(github_api(handler)).status_code == 200
+    assert sleeps == [7.0]
+
+
+def test_rate_limit_reset_ignored_while_requests_remain(github_api, sleeps):
+    headers = {'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': str(int(NOW) + 7)}
+    handler = _replay(httpx.Response(500, headers=headers), httpx.Response(200))
+
+    assert _get(github_api(handler)).status_code == 200
+    assert sleeps == [GitHubAPI.BACKOFF_FACTOR]
+
+
+def test_wait_beyond_max_retry_after_is_returned(github_api, sleeps):
+    wait = str(GitHubAPI.MAX_RETRY_AFTER + 1)
+    handler = _replay(httpx.Response(429, headers={'Retry-After': wait}), httpx.Response(200))
+
+    assert _get(github_api(handler)).status_code == 429
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+def test_exponential_backoff_until_max_retries(github_api, sleeps):
+    handler = _replay(httpx.Response(503))
+
+    assert _get(github_api(handler)).status_code == 503
+    assert len(handler.requests) == GitHubAPI.MAX_RETRIES + 1
+    assert sleeps == [GitHubAPI.BACKOFF_FACTOR * 2 ** n for n in range(GitHubAPI.MAX_RETRIES)]
+
+
+def test_client_errors_are_not_retried(github_api, sleeps):
+    handler = _replay(httpx.Response(404))
+
+    with pytest.raises(GitHubAPIError, match='Failed to get PR diff'):
+        asyncio.run(github_api(handler).get_pr_diff(7))
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+def test_posts_are_not_retried_on_status(github_api, sleeps):
+    handler = _replay(httpx.Response(503, headers={'Retry-After': '1'}), httpx.Response(201))
+
+    with pytest.raises(GitHubAPIError, match='Failed to post commit status'):
+        asyncio.run(github_api(handler).post_commit_status('abc123', 'success', 'ok'))
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+class CountingLimiter:
+    """Stands in for the AsyncLimiter and counts acquisitions."""
+
+    def __init__(self):
+        self.acquired = 0
+
+    async def __aenter__(self):
+        self.acquired += 1
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+def _blob_server():
+    """A handler serving blob SHA s as the content 'blob s', recording SHAs fetched."""
+    fetched = []
+
+    def handler(request):
+        sha = request.url.path.rsplit('/', 1)[-1]
+        fetched.append(sha)
+        content = base64.b64encode(f'blob {sha}'.encode()).decode()
+        return httpx.Response(200, json={'content': content, 'encoding': 'base64'})
+    handler.fetched = fetched
+    return handler
+
+
+def _get_blobs(api, shas):
+    async def get_all():
+        return [await api.get_blob(sha) for sha in shas]
+    return asyncio.run(get_all())
+
+
+def test_blob_cache_evicts_least_recently_used(github_api):
+    handler = _blob_server()
+    api = github_api(handler)
+    api.BLOB_CACHE_SIZE = 2
+
+    contents = _get_blobs(api, ['a', 'b', 'a', 'c', 'b', 'a', 'c'])
+
+    assert contents == ['blob a', 'blob b', 'blob a', 'blob c', 'blob b', 'blob a', 'blob c']
+    # 'a' was used after 'b', so 'c' evicts 'b'; from then on each miss
+    # evicts the blob used longest ago.
+    assert handler.fetched == ['a', 'b', 'c', 'b', 'a', 'c']
+    assert list(api._blob_cache) == ['a', 'c']
+
+
+def test_only_cache_misses_take_the_rate_limit(github_api):
+    handler = _blob_server()
+    api = github_api(handler)
+    api._limiter = CountingLimiter()
+
+    _get_blobs(api, ['a', 'a', 'b', 'a', 'b'])
+
+    assert handler.fetched == ['a', 'b']
+    assert api._limiter.acquired == 2
+
+
+def test_undecodable_blob(github_api):
+    api = github_api(lambda request: httpx.Response(200, json={'sha': 'a'}))
+
+    with pytest.raises(GitHubAPIError, match='Failed to decode blob'):
+        _get_blobs(api, ['a'])
+    assert 'a' not in api._blob_cache
@@ -0,0 +1,84 @@
+import asyncio
+
+from src.license_checker import LicenseChecker
+
+
+class FakeGitHubAPI:
+    """Serves files from a dict of path -> content, keyed by blob SHA.
+
+    Paths in unreadable are listed but fail to fetch.
+    """
+
+    def __init__(self, files, proprietary=False, enabled=True, unreadable=()):
+        self.config = {'license_check_enabled': enabled}
+        self._files = files
+        self._proprietary = proprietary
+        self._unreadable = unreadable
+
+    async def get_files(self):
+        return [(path, f'sha-{path}') for path in [*self._files, *self._unreadable]]
+
+    async def get_blob(self, sha):
+        path = sha[len('sha-'):]
+        if path not in self._files:
+            raise KeyError(path)
+        return self._files[path]
+
+    def is_proprietary(self):
+        return self._proprietary
+
+
+def _scan(api):
+    return asyncio.run(LicenseChecker(api).scan())
+
+
+def _summary(issues):
+    return [(i['file'], i['line'], i['type'], i['message']) for i in issues]
+
+
+def test_first_restricted_license_per_line():
+    files = {
+        'LICENSE': (
+            "Copyright (c) 2024 Example\n"
+            "Dual licensed: GPL-3.0 or LGPL-2.1\n"
+            "Also AGPL\n"
+            "LGPL-2.1 and GPL-2.0"
+        ),
+    }
+
+    assert _summary(_scan(FakeGitHubAPI(files))) == [
+        ('LICENSE', 2, 'restricted_license', "Found restricted license 'GPL-3.0'"),
+        ('LICENSE', 3, 'restricted_license', "Found restricted license 'AGPL'"),
+        ('LICENSE', 4, 'restricted_license', "Found restricted license 'LGPL-2.1'"),
+    ]
+
+
+def test_gpl_conflict_in_proprietary_project():
+    files = {'a.py': "# Copyright (c) 2024 Example\n# GPL-2.0 or LGPL-2.1\n# LGPL-3.0\n"}
+
+    assert _summary(_scan(FakeGitHubAPI(files, proprietary=True))) == [
+        ('a.py', 2, 'restricted_license', "Found restricted license 'GPL-2.0'"),
+        ('a.py', 2, 'license_conflict', 'GPL in proprietary project'),
+        ('a.py', 3, 'restricted_license', "Found restricted license 'LGPL-3.0'"),
+    ]
+
+
+def test_missing_copyright():
+    files = {'a.py': 'x = 1\n', 'b.py': 'Copyright (c) 2023 Example\n'}
+
+    assert _summary(_scan(FakeGitHubAPI(files))) == [
+        ('a.py', 0, 'missing_copyright', 'Missing copyright header'),
+    ]
+
+
+def test_unreadable_files_are_skipped():
+    files = {'a.py': 'Copyright (c) 2024 Example\nGPL\n'}
+    api = FakeGitHubAPI(files, unreadable=('gone.py',))
+
+    assert _summary(_scan(api)) == [
+        ('a.py', 2, 'restricted_license', "Found restricted license 'GPL'"),
+    ]
+
+
+def test_disabled():
+    assert _scan(FakeGitHubAPI({'a.py': 'GPL'}, enabled=False)) == []
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import os
+import shutil
+from pathlib import Path
+
+import httpx
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DIFF = (
+    "diff --git a/app.py b/app.py\n"
+    "--- a/app.py\n"
+    "+++ b/app.py\n"
+    "@@ -1,0 +1,3 @@\n"
+    "+password = 'hunter2'\n"
+    "+def Run():\n"
+    "+    log.info('run')\n"
+)
+
+
+@pytest.fixture(scope='module')
+def main(tmp_path_factory):
+    # src.main reads config.yml and opens logs/audit.log in the working
+    # directory when it is imported.
+    workdir = tmp_path_factory.mktemp('app')
+    shutil.copy(REPO_ROOT / 'config.yml', workdir)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        from src import main
+    finally:
+        os.chdir(cwd)
+    yield main
+    main.audit_logger.close()
+
+
+class FakeAuditLogger:
+    def __init__(self):
+        self.scans = []
+
+    def log_scan(self, pr_number, commit_sha, findings, policy_action):
+        self.scans.append((pr_number, commit_sha, findings, policy_action))
+
+
+class FakeGitHub:
+    """Serves DIFF for PR 7 and records the comments and statuses posted."""
+
+    def __init__(self, diff_status=200):
+        self.diff_status = diff_status
+        self.comments = []
+        self.statuses = []
+
+    def __call__(self, request):
+        path = request.url.path
+        if request.method == 'GET' and path == '/repos/owner/repo/pulls/7':
+            return httpx.Response(self.diff_status, text=DIFF)
+        if request.method == 'POST' and path == '/repos/owner/repo/issues/7/comments':
+            self.comments.append(json.loads(request.content)['body'])
+            return httpx.Response(201, json={})
+        if request.method == 'POST' and path == '/repos/owner/repo/statuses/abc123':
+            self.statuses.append(json.loads(request.content))
+            return httpx.Response(201, json={})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def run_pr(main, monkeypatch, github_api):
+    """Run process_pr for PR 7 against a FakeGitHub in the given policy mode."""
+    def run(mode, github=None):
+        github = github or FakeGitHub()
+        audit = FakeAuditLogger()
+        monkeypatch.setitem(main.config, 'policy', {'mode': mode})
+        monkeypatch.setattr(main, 'github_api', github_api(github))
+        monkeypatch.setattr(main, 'audit_logger', audit)
+        asyncio.run(main.process_pr(7, 'abc123'))
+        return github, audit
+    return run
+
+
+def test_advisory_comments_on_every_finding(run_pr):
+    github, audit = run_pr('ADVISORY')
+
+    [comment] = github.comments
+    assert 'Guardrails found 2 issue(s)' in comment
+    assert '**CRITICAL** `app.py:1`' in comment
+    assert 'Hardcoded secret detected' in comment
+    assert '**MEDIUM** `app.py:2`' in comment
+    assert 'Function name should be snake_case' in comment
+    assert github.statuses == [{'state': 'success', 'description': 'Guardrails: Warnings found'}]
+    [(pr_number, sha, findings, action)] = audit.scans
+    assert (pr_number, sha, action) == ('7', 'abc123', 'WARNED')
+    assert [(f['line'], f['category']) for f in findings] == [(1, 'security'), (2, 'standards')]
+
+
+def test_blocking_fails_the_commit_on_critical(run_pr):
+    github, audit = run_pr('BLOCKING')
+
+    assert len(github.comments) == 1
+    assert github.statuses == [{'state': 'failure', 'description': 'Guardrails: Critical issues found'}]
+    assert audit.scans[0][3] == 'BLOCKED'
+
+
+def test_warning_comments_on_high_and_critical_only(run_pr):
+    github, audit = run_pr('WARNING')
+
+    [comment] = github.comments
+    assert 'Guardrails found 1 issue(s)' in comment
+    assert 'app.py:2' not in comment
+    assert github.statuses == [{'state': 'success', 'description': 'Guardrails: Warnings found'}]
+    assert audit.scans[0][3] == 'WARNED'
+    assert len(audit.scans[0][2]) == 2
+
+
+def test_github_failure_sets_error_status(run_pr):
+    github, audit = run_pr('ADVISORY', FakeGitHub(diff_status=404))
+
+    assert github.comments == []
+    assert [status['state'] for status in github.statuses] == ['error']
+    assert github.statuses[0]['description'].startswith('Guardrails error: Failed to get PR diff')
+    assert audit.scans == []
+
+
+def test_shutdown_waits_for_scans_then_closes(main, monkeypatch):
+    events = []
+
+    class Closable:
+        async def aclose(self):
+            events.append('aclose')
+
+        def close(self):
+            events.append('close')
+
+    async def scan():
+        await asyncio.sleep(0.01)
+        events.append('scan')
+
+    async def serve():
+        async with main.lifespan(main.app):
+            task = asyncio.create_task(scan())
+            main._scan_tasks.add(task)
+            task.add_done_callback(main._scan_tasks.discard)
+
+    monkeypatch.setattr(main, 'github_api', Closable())
+    monkeypatch.setattr(main, 'audit_logger', Closable())
+    asyncio.run(serve())
+
+    assert events == ['scan', 'aclose', 'close']
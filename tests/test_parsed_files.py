@@ -0,0 +1,42 @@
+import sys
+
+import pytest
+
+from src.parsed_files import FileChange, ParsedFiles
+
+
+def test_offsets_span_each_file_in_joined_buffer():
+    changes = [
+        FileChange('a.py', 'one\ntwo'),
+        FileChange('empty.py', ''),
+        FileChange('b.py', 'three\n'),
+    ]
+    parsed = ParsedFiles.from_changes(changes)
+
+    assert parsed.joined == 'one\ntwo\n\nthree\n'
+    assert parsed.file_offsets == [0, 8, 9, 16]
+    assert list(parsed.files()) == [('a.py', 0, 7), ('empty.py', 8, 8), ('b.py', 9, 15)]
+    for (name, start, end), change in zip(parsed.files(), changes):
+        assert name == change.file
+        assert parsed.joined[start:end] == change.content
+
+
+def test_no_files():
+    parsed = ParsedFiles.from_changes([])
+
+    assert parsed.joined == ''
+    assert parsed.file_offsets == [0]
+    assert list(parsed.files()) == []
+
+
+def test_names_are_interned():
+    name = ''.join(['a', '.py'])
+    parsed = ParsedFiles.from_changes([FileChange(name, '')])
+
+    assert parsed.names[0] is sys.intern('a.py')
+
+
+@pytest.mark.parametrize('file, content', [(None, 'x'), ('a.py', b'x'), ('a.py', None)])
+def test_file_change_rejects_non_strings(file, content):
+    with pytest.raises(TypeError):
+        FileChange(file, content)
@@ -0,0 +1,49 @@
+import pytest
+
+from src.policy_engine import PolicyEngine
+
+ISSUES = [
+    {'severity': 'LOW'},
+    {'severity': 'CRITICAL'},
+    {'severity': 'MEDIUM'},
+    {'severity': 'HIGH'},
+]
+
+
+def test_advisory_keeps_all_issues():
+    assert PolicyEngine({'mode': 'ADVISORY'}).apply_policy(ISSUES) == {
+        'post_comment': True,
+        'block_merge': False,
+        'filtered_issues': ISSUES,
+    }
+
+
+def test_warning_keeps_high_and_critical():
+    result = PolicyEngine({}).apply_policy(ISSUES)
+
+    assert result['filtered_issues'] == [{'severity': 'CRITICAL'}, {'severity': 'HIGH'}]
+    assert result['block_merge'] is False
+
+
+def test_blocking_blocks_on_critical():
+    engine = PolicyEngine({'mode': 'BLOCKING'})
+
+    assert engine.apply_policy(ISSUES)['block_merge'] is True
+    assert engine.apply_policy([{'severity': 'HIGH'}])['block_merge'] is False
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        PolicyEngine({'mode': 'STRICT'})
+
+
+@pytest.mark.parametrize('mode', ['ADVISORY', 'WARNING', 'BLOCKING'])
+def test_malformed_issues(mode):
+    engine = PolicyEngine({'mode': mode})
+
+    with pytest.raises(TypeError, match="^issues must be a list$"):
+        engine.apply_policy(tuple(ISSUES))
+    with pytest.raises(TypeError, match="^Issue at index 1 is not a dictionary$"):
+        engine.apply_policy([{'severity': 'LOW'}, 'oops', {}])
+    with pytest.raises(ValueError, match="^Issue at index 2 missing 'severity' key$"):
+        engine.apply_policy([{'severity': 'LOW'}, {'severity': 'HIGH'}, {}])
@@ -0,0 +1,43 @@
+from src.scanner import PRScanner
+
+DIFF = (
+    "diff --git a/app.py b/app.py\n"
+    "index 83db48f..bf269f4 100644\n"
+    "--- a/app.py\n"
+    "+++ b/app.py\n"
+    "@@ -10,4 +10,5 @@ def main():\n"
+    " context_one\n"
+    "-removed_line\n"
+    "+added_one\n"
+    "+added_two\n"
+    " context_two\n"
+    "@@ -40,2 +41,3 @@\n"
+    "+++not_a_header\n"
+    " context_three\n"
+    "diff --git a/gone.py b/gone.py\n"
+    "deleted file mode 100644\n"
+    "--- a/gone.py\n"
+    "+++ /dev/null\n"
+    "@@ -1,1 +0,0 @@\n"
+    "-bye\n"
+    "diff --git a/new.py b/new.py\n"
+    "new file mode 100644\n"
+    "--- /dev/null\n"
+    "+++ b/new.py\n"
+    "@@ -0,0 +1,2 @@\n"
+    "+first\n"
+    "+\n"
+)
+
+
+def test_scan_pr_yields_added_lines():
+    assert list(PRScanner().scan_pr(DIFF)) == [
+        {'filename': 'app.py', 'line_number': 11, 'content': 'added_one'},
+        {'filename': 'app.py', 'line_number': 12, 'content': 'added_two'},
+        {'filename': 'new.py', 'line_number': 1, 'content': 'first'},
+        {'filename': 'new.py', 'line_number': 2, 'content': ''},
+    ]
+
+
+def test_scan_pr_empty_diff():
+    assert list(PRScanner().scan_pr('')) == []
@@ -0,0 +1,60 @@
+from src.parsed_files import FileChange, ParsedFiles
+from src.security_rules import SecurityScanner
+
+# Fixture sources for the scanner, never executed. The last line has no
+# trailing newline.
+DB = (
+    "password = 'hunter2'\n"
+    "cursor.execute(\"SELECT * FROM t WHERE id = %s\" % uid)\n"
+    "safe = 1\n"
+    "result = eval(expr); os.system('rm ' + path)\n"
+    "query = 'SELECT {}'.format(name)"
+)
+
+EXPECTED = [
+    ('db.py', 1, 'CRITICAL', 'A02: Cryptographic Failures (CWE-798)'),
+    ('db.py', 2, 'CRITICAL', 'A01: Injection (CWE-89)'),
+    ('db.py', 4, 'HIGH', 'A01: Injection (CWE-94)'),
+    ('db.py', 4, 'HIGH', 'A01: Injection (CWE-78)'),
+    ('db.py', 5, 'CRITICAL', 'A01: Injection (CWE-89)'),
+    ('cfg.py', 1, 'CRITICAL', 'A02: Cryptographic Failures (CWE-798)'),
+]
+
+
+def _changes():
+    return [
+        FileChange('db.py', DB),
+        FileChange('clean.py', 'x = 1\n'),
+        FileChange('cfg.py', 'api_key = "abc"'),
+    ]
+
+
+def _summary(issues):
+    return [(i['file'], i['line'], i['severity'], i['type']) for i in issues]
+
+
+def test_scan_reports_issues_in_order():
+    assert _summary(SecurityScanner().scan(_changes())) == EXPECTED
+
+
+def test_scan_accepts_parsed_files():
+    parsed = ParsedFiles.from_changes(_changes())
+
+    assert _summary(SecurityScanner().scan(parsed)) == EXPECTED
+
+
+def test_issue_fields():
+    issues = SecurityScanner().scan([FileChange('a.py', 'x = 1\ny = eval(s)\n')])
+
+    assert issues == [{
+        'file': 'a.py',
+        'line': 2,
+        'severity': 'HIGH',
+        'type': 'A01: Injection (CWE-94)',
+        'message': 'Use of eval() function detected',
+        'fix': 'Avoid eval(); use safer alternatives like ast.literal_eval()'
+    }]
+
+
+def test_clean_files():
+    assert SecurityScanner().scan([FileChange('a.py', ''), FileChange('b.py', 'x = 1\n')]) == []
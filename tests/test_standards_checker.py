@@ -0,0 +1,94 @@
+from src.parsed_files import FileChange, ParsedFiles
+from src.standards_checker import StandardsChecker
+
+ENABLED = {'rules': {'standards': {'enabled': True}}}
+
+# Ends without a newline, on a def whose next line would be the first line
+# of the following file in the joined buffer.
+CHECKOUT = (
+    "class order_service:\n"
+    "    def Process(self, order):\n"
+    "        logger.info('processing %s', order)\n"
+    "        try:\n"
+    "            self.submit(order)\n"
+    "        except:\n"
+    "            pass\n"
+    "\n"
+    "    def refund(self, order):\n"
+    "        return order\n"
+    "\n"
+    "def Retry(): pass  # except: give up\n"
+    "class Ok:\n"
+    "    def tail(self):"
+)
+UTILS = (
+    "import logging\n"
+    "def helper():\n"
+    "    log = logging.getLogger(__name__)\n"
+)
+
+EXPECTED = [
+    ('checkout.py', 1, 'naming'),
+    ('checkout.py', 2, 'naming'),
+    ('checkout.py', 6, 'error_handling'),
+    ('checkout.py', 9, 'missing_logging'),
+    ('checkout.py', 12, 'naming'),
+    ('checkout.py', 12, 'error_handling'),
+    ('checkout.py', 12, 'missing_logging'),
+    ('checkout.py', 14, 'missing_logging'),
+]
+
+
+def _changes():
+    return [FileChange('checkout.py', CHECKOUT), FileChange('utils.py', UTILS)]
+
+
+def _summary(violations):
+    return [(v['file'], v['line'], v['type']) for v in violations]
+
+
+def test_scan_reports_violations_in_order():
+    assert _summary(StandardsChecker(ENABLED).scan(_changes())) == EXPECTED
+
+
+def test_scan_accepts_parsed_files():
+    parsed = ParsedFiles.from_changes(_changes())
+
+    assert _summary(StandardsChecker(ENABLED).scan(parsed)) == EXPECTED
+
+
+def test_iter_scan_matches_scan():
+    checker = StandardsChecker(ENABLED)
+
+    assert list(checker.iter_scan(_changes())) == checker.scan(_changes())
+
+
+def test_violation_fields():
+    violations = StandardsChecker(ENABLED).scan([FileChange('x.py', 'try:\n    run()\nexcept:\n    pass\n')])
+
+    assert violations == [{
+        'file': 'x.py',
+        'line': 3,
+        'severity': 'MEDIUM',
+        'type': 'error_handling',
+        'message': 'Bare except clause',
+        'fix': 'Specify exception type or use Exception'
+    }]
+
+
+def test_messages_per_type():
+    violations = StandardsChecker(ENABLED).scan([FileChange('x.py', 'def Run(): pass  # except: no')])
+
+    assert [(v['type'], v['message']) for v in violations] == [
+        ('naming', 'Function name should be snake_case'),
+        ('error_handling', 'Bare except clause'),
+        ('missing_logging', 'Function missing logging statement'),
+    ]
+
+
+def test_disabled_returns_empty_list():
+    for config in ({}, {'rules': {'standards': {'enabled': False}}}):
+        checker = StandardsChecker(config)
+
+        assert checker.scan(_changes()) == []
+        assert list(checker.iter_scan(_changes())) == []